@@ -0,0 +1,45 @@
+"""Time task row creation: python bench_render.py [rows]
+
+Runs against a temporary HOME so real data in ~/.todo_app is never
+touched. Only uses AdvancedTodoApp(root) and create_task_item(parent,
+task), so the same script can be run on older checkouts to compare.
+"""
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+from tkinter import ttk
+
+
+def time_rows(app, root, rows):
+    """Return the average seconds per create_task_item call, layout included"""
+    container = ttk.Frame(root)
+    start = time.perf_counter()
+    for n in range(rows):
+        app.create_task_item(container, {"title": f"Task {n}", "category": "Home", "completed": False})
+    root.update_idletasks()
+    elapsed = time.perf_counter() - start
+    container.destroy()
+    return elapsed / rows
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from todo_app import AdvancedTodoApp
+
+        root = tk.Tk()
+        root.withdraw()
+        app = AdvancedTodoApp(root)
+
+        # Warm-up pass so font and style lookups are cached
+        time_rows(app, root, rows)
+        per_row = min(time_rows(app, root, rows) for _ in range(3))
+        root.destroy()
+    print(f"create_task_item: {per_row * 1000:.3f} ms/row over {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
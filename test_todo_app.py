@@ -0,0 +1,416 @@
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import tkinter as tk
+import tkinter.font as tkfont
+import tracemalloc
+import unittest
+from datetime import date
+from tkinter import ttk
+from unittest import mock
+
+from todo_app import DATA_VERSION, THEMES, AdvancedTodoApp
+
+
+class StorageTestCase(unittest.TestCase):
+    """Runs the storage code on an app without a window, so no display is needed"""
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.messagebox = self.enter(mock.patch("todo_app.messagebox"))
+        self.enter(contextlib.redirect_stdout(io.StringIO()))  # loads and saves print
+        self.app = self.make_app()
+
+    def enter(self, context):
+        result = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        return result
+
+    def make_app(self):
+        """Return an app with storage set up but no widgets"""
+        app = AdvancedTodoApp.__new__(AdvancedTodoApp)
+        app.root = mock.Mock()
+        app.init_storage(self.data_dir.name)
+        app.current_category = {"name": "Home"}
+        app.update_task_list = mock.Mock()
+        app.update_category_counts = mock.Mock()
+        return app
+
+    def write_json(self, path, data):
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    def read_header(self, path):
+        with open(path, 'rb') as f:
+            return json.loads(f.readline())
+
+
+class MigrationTest(StorageTestCase):
+    """Older data files are upgraded once, current ones take the fast path"""
+
+    def test_v1_list_is_migrated_and_rewritten(self):
+        self.write_json(self.app.tasks_file, ["Buy milk", {"title": "Report", "category": "Work", "completed": True}])
+
+        self.app.load_data()
+
+        self.assertEqual(self.app.tasks, [
+            {"title": "Buy milk", "category": "Home", "completed": False},
+            {"title": "Report", "category": "Work", "completed": True},
+        ])
+        self.assertEqual(self.read_header(self.app.tasks_file)["version"], DATA_VERSION)
+        self.assertEqual(self.read_header(self.app.categories_file)["version"], DATA_VERSION)
+
+    def test_v2_file_is_migrated(self):
+        tasks = [{"title": "Report", "category": "Work", "completed": False}]
+        self.write_json(self.app.tasks_file, {"version": 2, "tasks": tasks})
+
+        self.assertEqual(self.app.read_versioned_file(self.app.tasks_file, "tasks"), (tasks, True))
+
+    def test_current_version_takes_fast_path(self):
+        tasks = [{"title": "Report", "category": "Work", "completed": False}]
+        self.app.write_versioned_file(self.app.tasks_file, "tasks", tasks)
+
+        with mock.patch.object(self.app, "migrate_data") as migrate_data:
+            records, migrated = self.app.read_versioned_file(self.app.tasks_file, "tasks")
+
+        self.assertEqual((records, migrated), (tasks, False))
+        migrate_data.assert_not_called()
+
+    def test_newer_version_blocks_saving(self):
+        self.write_json(self.app.tasks_file, {"version": DATA_VERSION + 1, "tasks": []})
+
+        self.app.load_data()
+
+        self.assertTrue(self.app.load_failed)
+        self.messagebox.showerror.assert_called_once()
+        self.assertFalse(self.app.save_data())
+
+
+class RecoveryTest(StorageTestCase):
+    """Damaged snapshots fall back to the newest backup that verifies"""
+
+    old_tasks = [{"title": "Old", "category": "Home", "completed": False}]
+    new_tasks = [{"title": "New", "category": "Home", "completed": False}]
+
+    def setUp(self):
+        super().setUp()
+        self.path = self.app.tasks_file
+        self.app.write_versioned_file(self.path, "tasks", self.old_tasks)
+        self.app.write_versioned_file(self.path, "tasks", self.new_tasks)
+
+    def damage(self, path, keep=None, flip=None):
+        """Truncate a file to keep bytes, or flip the byte at offset flip"""
+        with open(path, 'rb') as f:
+            content = bytearray(f.read())
+        if keep is not None:
+            content = content[:keep]
+        if flip is not None:
+            content[flip] ^= 0xFF
+        with open(path, 'wb') as f:
+            f.write(content)
+
+    def test_checksum_mismatch_uses_backup(self):
+        self.damage(self.path, flip=-3)
+
+        self.assertEqual(self.app.read_versioned_file(self.path, "tasks"), (self.old_tasks, True))
+        self.assertTrue(os.path.exists(self.path + ".corrupt"))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_truncated_file_uses_backup(self):
+        for keep in (0, 10, os.path.getsize(self.path) // 2):
+            with self.subTest(keep=keep):
+                self.app.write_versioned_file(self.path, "tasks", self.new_tasks)
+                self.damage(self.path, keep=keep)
+
+                records, migrated = self.app.read_versioned_file(self.path, "tasks")
+
+                self.assertEqual(records, self.new_tasks)
+                self.assertTrue(migrated)
+
+    def test_recovery_keeps_good_backup(self):
+        self.damage(self.path, flip=-3)
+
+        self.app.load_data()
+        self.app.tasks.append({"title": "Later", "category": "Home", "completed": False})
+        self.app.save_data()
+
+        # The damaged file was moved aside, so the good snapshot is still .1
+        self.assertEqual(self.app.read_snapshot(self.path + ".1")[1], self.old_tasks)
+
+    def test_damaged_backups_are_compacted(self):
+        self.app.write_versioned_file(self.path, "tasks", self.new_tasks)
+        self.damage(self.path, keep=10)
+        self.damage(self.path + ".1", flip=-3)
+
+        self.assertEqual(self.app.read_versioned_file(self.path, "tasks"), (self.old_tasks, True))
+        self.assertTrue(os.path.exists(self.path + ".1.corrupt"))
+        self.assertEqual(self.app.read_snapshot(self.path + ".1")[1], self.old_tasks)
+        self.assertFalse(os.path.exists(self.path + ".2"))
+
+    def test_nothing_readable_starts_fresh(self):
+        os.remove(self.path + ".1")
+        self.damage(self.path, flip=-3)
+
+        self.app.load_data()
+
+        self.messagebox.showwarning.assert_called_once()
+        self.assertEqual(self.app.tasks, [])
+        self.assertFalse(self.app.load_failed)
+        self.assertTrue(os.path.exists(self.path + ".corrupt"))
+        self.assertTrue(self.app.save_data())
+
+
+class FixedDate(date):
+    """date whose today() is controlled by the test"""
+
+    current = date(2026, 10, 19)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class OccurrenceTest(StorageTestCase):
+    """Recurring tasks show one occurrence per window and compact when toggled"""
+
+    def setUp(self):
+        super().setUp()
+        self.enter(mock.patch("todo_app.date", FixedDate))
+        FixedDate.current = date(2026, 10, 19)
+        self.task = {
+            "title": "Water plants",
+            "category": "Home",
+            "completed": False,
+            "recurrence": {"freq": "daily", "interval": 1, "start": "2026-10-01"},
+            "exceptions": []
+        }
+        self.app.tasks = [self.task]
+
+    def occurrences(self):
+        return [(row["occurrence"], row["completed"]) for row in self.app.get_task_rows()]
+
+    def test_missed_occurrences_jump_to_today(self):
+        self.assertEqual(self.occurrences(), [("2026-10-19", False)])
+
+        self.task["recurrence"].update(freq="weekly", start="2026-09-01")
+        self.assertEqual(self.occurrences(), [("2026-10-13", False)])
+
+    def test_toggle_compacts_exceptions(self):
+        self.app.toggle_occurrence(self.app.get_task_rows()[0])
+
+        self.assertEqual(self.task["recurrence"]["start"], "2026-10-20")
+        self.assertEqual(self.task["exceptions"], ["2026-10-19"])
+        self.assertEqual(self.occurrences(), [("2026-10-19", True)])
+
+        FixedDate.current = date(2026, 10, 20)
+        self.app.toggle_occurrence(self.app.get_task_rows()[0])
+
+        self.assertEqual(self.task["recurrence"]["start"], "2026-10-21")
+        self.assertEqual(self.task["exceptions"], ["2026-10-20"])
+
+    def test_reopen_restores_occurrence(self):
+        self.app.toggle_occurrence(self.app.get_task_rows()[0])
+        self.app.toggle_occurrence(self.app.get_task_rows()[0])
+
+        self.assertEqual(self.task["recurrence"]["start"], "2026-10-19")
+        self.assertEqual(self.task["exceptions"], [])
+        self.assertEqual(self.occurrences(), [("2026-10-19", False)])
+
+
+class ShardTest(StorageTestCase):
+    """Sharded saves only rewrite the categories that changed"""
+
+    def setUp(self):
+        super().setUp()
+        self.app.sharded = True
+        self.app.tasks = [
+            {"title": "Report", "category": "Work", "completed": False},
+            {"title": "Gym", "category": "Personal", "completed": False},
+        ]
+        self.app.mark_all_dirty()
+        self.assertTrue(self.app.save_data())
+
+    def shard_path(self, app, name):
+        return os.path.join(app.shards_dir, app.shard_files[name])
+
+    def test_save_rewrites_only_dirty_shards(self):
+        app = self.make_app()
+        app.load_data()
+        report = next(task for task in app.tasks if task["title"] == "Report")
+
+        self.assertTrue(app.mark_dirty(report))
+        report["completed"] = True
+        self.assertTrue(app.save_data())
+
+        # Each rewrite keeps the previous snapshot as .1
+        self.assertTrue(os.path.exists(self.shard_path(app, "Work") + ".1"))
+        self.assertFalse(os.path.exists(self.shard_path(app, "Personal") + ".1"))
+        self.assertFalse(os.path.exists(app.manifest_file + ".1"))
+        self.assertEqual(app.dirty_shards, set())
+
+    def test_other_shards_load_when_idle(self):
+        self.app.current_category = {"name": "Work"}
+        self.app.write_manifest()
+
+        app = self.make_app()
+        app.load_data()
+
+        self.assertEqual([task["title"] for task in app.tasks], ["Report"])
+        self.assertEqual(app.pending_shards, ["Personal"])
+        app.root.after_idle.assert_called_once_with(app.load_next_shard)
+
+        app.load_next_shard()
+        self.assertEqual(len(app.tasks), 2)
+        app.update_task_list.assert_called_once()
+
+
+class DisplayTestCase(unittest.TestCase):
+    """Runs against a hidden window, skipped when no display is available"""
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as e:
+            self.skipTest(f"No display available: {e}")
+        self.root.withdraw()
+        self.data_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.root.destroy()
+        self.data_dir.cleanup()
+
+
+class SoakTest(DisplayTestCase):
+    """Long-session memory regression test"""
+
+    cycles = 2000
+    warmup = 200
+    slack = 50  # allowed growth in widget, variable, binding and object counts
+    heap_slack = 1024 * 1024  # allowed traced heap growth in bytes
+    block_slack = 16 * 1024  # allowed growth in allocated heap blocks
+
+    def run_cycles(self, app, cycles):
+        """Script add/toggle/delete cycles, returning stats after warmup and at the end"""
+        baseline = None
+        for cycle in range(cycles):
+            if cycle == self.warmup:
+                gc.collect()
+                baseline = app.get_resource_stats()
+
+            task = {"title": f"Soak task {cycle}", "category": "Work", "completed": False}
+            app.mark_dirty(task)
+            app.tasks.append(task)
+            app.update_task_list()
+            app.update_category_counts()
+            app.save_data()
+            app.toggle_task_completion(task)
+            app.discard_task(task)
+            self.root.update()
+
+        gc.collect()
+        return baseline, app.get_resource_stats()
+
+    def soak(self, cycles, leak=None):
+        """Run the cycles against a fresh app and return the resources that grew too much"""
+        with open(os.devnull, 'w') as devnull:
+            stdout = sys.stdout
+            sys.stdout = devnull  # save_data prints on every cycle
+            tracemalloc.start()
+            try:
+                app = AdvancedTodoApp(self.root, data_dir=self.data_dir.name)
+                app.set_render_sampling(True)
+                if leak:
+                    leak(app)
+                baseline, final = self.run_cycles(app, cycles)
+            finally:
+                tracemalloc.stop()
+                sys.stdout = stdout
+
+        self.assertEqual(len(app.get_render_history()), app.render_samples.maxlen)
+        leaks = {}
+        for name, start in baseline.items():
+            if name == "renders":
+                continue
+            limit = {"heap_bytes": self.heap_slack, "heap_blocks": self.block_slack}.get(name, self.slack)
+            if final[name] - start > limit:
+                leaks[name] = (start, final[name])
+        return leaks
+
+    def test_resources_do_not_grow(self):
+        self.assertEqual(self.soak(self.cycles), {})
+
+    def test_detects_leaked_variables(self):
+        # Keep every row's BooleanVar alive, as a leaking render would
+        kept = []
+
+        def leak(app):
+            create_task_item = app.create_task_item
+
+            def leaking_create_task_item(parent, task):
+                create_task_item(parent, task)
+                kept.append(tk.BooleanVar(app.root))
+
+            app.create_task_item = leaking_create_task_item
+
+        leaks = self.soak(self.warmup + 300, leak)
+        self.assertIn("tcl_variables", leaks)
+
+
+class StyleRegistryTest(DisplayTestCase):
+    """Theme and font size changes reach rows that are already on screen"""
+
+    def setUp(self):
+        super().setUp()
+        with open(os.devnull, 'w') as devnull:
+            stdout = sys.stdout
+            sys.stdout = devnull
+            try:
+                self.app = AdvancedTodoApp(self.root, data_dir=self.data_dir.name)
+                self.app.tasks = [{"title": "Water plants", "category": "Home", "completed": False}]
+                self.app.update_task_list()
+            finally:
+                sys.stdout = stdout
+        self.card = self.app.tasks_container.winfo_children()[0]
+        self.title = self.find_label("Water plants")
+
+    def find_label(self, text):
+        stack = [self.card]
+        while stack:
+            widget = stack.pop()
+            if isinstance(widget, ttk.Label) and widget.cget("text") == text:
+                return widget
+            stack.extend(widget.winfo_children())
+        self.fail(f"No label with text {text!r}")
+
+    def test_theme_applies_in_place(self):
+        renders = self.app.render_count
+        self.app.set_theme("Dark")
+
+        dark = THEMES["Dark"]
+        self.assertEqual(self.app.render_count, renders)
+        self.assertTrue(self.card.winfo_exists())
+        self.assertEqual(str(self.card.cget("bg")), dark["bg_color"])
+        self.assertEqual(str(self.card.cget("highlightbackground")), dark["border_color"])
+        style = str(self.title.cget("style"))
+        self.assertEqual(str(self.app.style.lookup(style, "foreground")), dark["text_color"])
+        self.assertEqual(str(self.app.style.lookup(style, "background")), dark["bg_color"])
+
+    def test_font_size_applies_in_place(self):
+        renders = self.app.render_count
+        font = tkfont.nametofont(str(self.app.style.lookup(str(self.title.cget("style")), "font")))
+        size = font.cget("size")
+
+        self.app.change_font_size(1)
+
+        self.assertEqual(self.app.render_count, renders)
+        self.assertEqual(self.app.fonts["body"].name, font.name)
+        self.assertEqual(font.cget("size"), size + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
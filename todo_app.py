@@ -1,37 +1,117 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+import tkinter.font as tkfont
+from datetime import datetime, date, timedelta
+import gc
+import hashlib
 import json
 import os
+import shutil
+import sys
+import tracemalloc
+from collections import deque
+
+# Number of per-render resource samples kept for diagnostics
+RENDER_HISTORY = 200
+
+# Schema version written into the header of tasks.json and categories.json
+DATA_VERSION = 3
+
+# Number of rotating backups (tasks.json.1, tasks.json.2, ...) kept per data file
+BACKUP_COUNT = 3
+
+# Version 3+ files start with a one-line header that carries the body checksum
+SNAPSHOT_HEADER_PREFIX = b'{"checksum": '
+
+
+def migrate_v1_to_v2(data, key):
+    """Version 1 -> 2: bare lists get a header, string tasks become dicts"""
+    records = data[key]
+    if key == "tasks":
+        records = [
+            {"title": task, "category": "Home", "completed": False} if isinstance(task, str) else task
+            for task in records
+        ]
+    return {"version": 2, key: records}
+
+
+def migrate_v2_to_v3(data, key):
+    """Version 2 -> 3: records are unchanged, only the file gains a checksum header"""
+    return {"version": 3, key: data[key]}
+
+
+# Maps a schema version to the step that upgrades it to the next version
+MIGRATIONS = {
+    1: migrate_v1_to_v2,
+    2: migrate_v2_to_v3,
+}
+
+# Recurrence frequencies offered in the task dialogs, in days per interval
+REPEAT_OPTIONS = {
+    "Never": None,
+    "Daily": 1,
+    "Weekly": 7,
+}
+
+# Colour palettes selectable from the View menu
+THEMES = {
+    "Light": {
+        "bg_color": "#f0f2f5",  # Lighter background
+        "sidebar_color": "#ffffff",  # White sidebar
+        "primary_color": "#1a73e8",  # Google blue
+        "text_color": "#202124",  # Dark text
+        "light_text": "#5f6368",  # Google gray
+        "accent_color": "#ea4335",  # Google red
+        "on_primary_color": "#ffffff",  # Text drawn on primary_color
+        "hover_color": "#f8f9fa",
+        "border_color": "#e0e0e0"
+    },
+    "Dark": {
+        "bg_color": "#202124",
+        "sidebar_color": "#292a2d",
+        "primary_color": "#8ab4f8",
+        "text_color": "#e8eaed",
+        "light_text": "#9aa0a6",
+        "accent_color": "#f28b82",
+        "on_primary_color": "#202124",
+        "hover_color": "#35363a",
+        "border_color": "#3c4043"
+    }
+}
+
+# Named fonts shared by all widgets: name -> (base size, weight, overstrike)
+FONT_SIZES = {
+    "heading": (16, "bold", False),
+    "large": (12, "normal", False),
+    "body": (11, "normal", False),
+    "body_done": (11, "normal", True),
+    "button": (10, "normal", False),
+    "small": (9, "normal", False),
+    "category_icon": (14, "normal", False),
+}
 
 class AdvancedTodoApp:
-    def __init__(self, root):
+    def __init__(self, root, data_dir=None):
         self.root = root
         self.root.title("To-Do List Application")
         self.root.geometry("400x500")
         
-        # File paths
-        self.data_dir = os.path.join(os.path.expanduser("~"), ".todo_app")
-        self.tasks_file = os.path.join(self.data_dir, "tasks.json")
-        self.categories_file = os.path.join(self.data_dir, "categories.json")
+        # Data files and in-memory task storage
+        self.init_storage(data_dir)
         
-        # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-        
-        # Task storage
-        self.tasks = []
+        # Task list and sidebar re-renders; resource samples are only taken
+        # per render while sampling is switched on, as it walks every widget
+        self.render_count = 0
+        self.render_sampling = False
+        self.render_samples = deque(maxlen=RENDER_HISTORY)
         
         # Update color scheme for better UI
-        self.bg_color = "#f0f2f5"  # Lighter background
-        self.sidebar_color = "#ffffff"  # White sidebar
-        self.primary_color = "#1a73e8"  # Google blue
-        self.text_color = "#202124"  # Dark text
-        self.light_text = "#5f6368"  # Google gray
-        self.accent_color = "#ea4335"  # Google red
-        
-        # Configure root window
-        self.root.configure(bg=self.bg_color)
+        self.theme = "Light"
+        for attribute, value in THEMES[self.theme].items():
+            setattr(self, attribute, value)
+        
+        # Shared fonts and styles, also configures the root window
+        self.create_styles()
         
         # Add window padding
         self.root.grid_columnconfigure(0, weight=1)
@@ -44,6 +124,7 @@ class AdvancedTodoApp:
         self.create_main_layout()
         self.create_menu()
         self.load_data()
+        self.sharded_var.set(self.sharded)
         
         # Bind keyboard shortcuts
         self.bind_shortcuts()
@@ -56,32 +137,146 @@ class AdvancedTodoApp:
         # Set up auto-save on window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def init_storage(self, data_dir=None):
+        """Set up the data file paths and empty task storage, without any UI"""
+        # File paths
+        self.data_dir = data_dir or os.path.join(os.path.expanduser("~"), ".todo_app")
+        self.tasks_file = os.path.join(self.data_dir, "tasks.json")
+        self.categories_file = os.path.join(self.data_dir, "categories.json")
+        self.shards_dir = os.path.join(self.data_dir, "shards")
+        self.manifest_file = os.path.join(self.shards_dir, "manifest.json")
+        
+        # Ensure data directory exists
+        if not os.path.exists(self.data_dir):
+            os.makedirs(self.data_dir)
+        
+        # Task storage
+        self.tasks = []
+        
+        # Per-category shard storage, used when a shard manifest exists
+        self.sharded = False
+        self.shard_files = {}  # shard name -> file name inside shards_dir
+        self.pending_shards = []  # shards not yet loaded from disk
+        self.dirty_shards = set()  # shards changed since the last save
+        self.failed_shards = set()  # shards that could not be read, never rewritten
+        self.load_failed = False  # set when loading fails, blocks saving over the files
+        self.saved_category = None  # last viewed category recorded in the manifest
+
+    def create_styles(self):
+        """Create the shared named fonts and ttk styles used by every widget"""
+        self.style = ttk.Style(self.root)
+        self.font_offset = 0
+        
+        # Named fonts are resolved by Tk once and shared by all widgets
+        self.fonts = {
+            name: tkfont.Font(root=self.root, family="Segoe UI", size=size, weight=weight, overstrike=overstrike)
+            for name, (size, weight, overstrike) in FONT_SIZES.items()
+        }
+        self.icon_styles = {}  # category colour -> ttk style name
+        self.configure_styles()
+
+    def configure_styles(self):
+        """Apply the current palette to the ttk styles, updating live widgets in place"""
+        style = self.style
+        
+        # Main content area
+        style.configure("App.TFrame", background=self.bg_color)
+        style.configure("Heading.TLabel", background=self.bg_color, foreground=self.text_color, font=self.fonts["heading"])
+        style.configure("Empty.TLabel", background=self.bg_color, foreground=self.light_text, font=self.fonts["large"])
+        style.configure("Accent.TLabel", background=self.primary_color, foreground=self.on_primary_color, font=self.fonts["body"], padding=(15, 5))
+        
+        # Sidebar
+        style.configure("Sidebar.TFrame", background=self.sidebar_color)
+        style.configure("SidebarHover.TFrame", background=self.hover_color)
+        style.configure("SidebarHeading.TLabel", background=self.sidebar_color, foreground=self.text_color, font=self.fonts["heading"])
+        style.configure("Sidebar.TLabel", background=self.sidebar_color, foreground=self.text_color, font=self.fonts["body"])
+        style.configure("SidebarMuted.TLabel", background=self.sidebar_color, foreground=self.light_text, font=self.fonts["body"])
+        style.configure("SidebarLink.TLabel", background=self.sidebar_color, foreground=self.text_color, font=self.fonts["button"])
+        style.configure("CategoryIcon.TLabel", background=self.sidebar_color, foreground=self.text_color, font=self.fonts["category_icon"])
+        
+        # Task cards
+        style.configure("TaskContent.TFrame", background=self.bg_color)
+        style.configure("TaskTitle.TLabel", background=self.bg_color, foreground=self.text_color, font=self.fonts["body"])
+        style.configure("TaskDone.TLabel", background=self.bg_color, foreground=self.light_text, font=self.fonts["body_done"])
+        style.configure("TaskDetail.TLabel", background=self.bg_color, foreground=self.light_text, font=self.fonts["small"])
+        style.configure("TaskAction.TLabel", background=self.bg_color, font=self.fonts["large"])
+        style.configure(
+            "Custom.TCheckbutton",
+            background=self.bg_color,
+            foreground=self.text_color,
+            font=self.fonts["body"],
+            indicatorbackground=self.sidebar_color,
+            indicatorforeground=self.primary_color
+        )
+        style.map(
+            "Custom.TCheckbutton",
+            background=[("active", self.hover_color)],
+            indicatorbackground=[("pressed", self.hover_color), ("selected", self.sidebar_color)]
+        )
+        
+        # Plain tk widgets are updated directly: the root, the main container
+        # and the card frames, which keep tk's highlight border since most
+        # ttk themes ignore bordercolor
+        self.root.configure(bg=self.bg_color)
+        if hasattr(self, 'main_container'):
+            self.main_container.configure(bg=self.bg_color, highlightbackground=self.border_color)
+        if hasattr(self, 'tasks_container'):
+            for card in self.tasks_container.winfo_children():
+                if isinstance(card, tk.Frame):
+                    card.configure(bg=self.bg_color, highlightbackground=self.border_color)
+
+    def get_icon_style(self, color):
+        """Return the ttk style for a category icon of the given colour"""
+        if color == "#FFFFFF":
+            return "CategoryIcon.TLabel"
+        if color not in self.icon_styles:
+            # Inherits background and font from CategoryIcon.TLabel
+            self.icon_styles[color] = f"C{color.lstrip('#')}.CategoryIcon.TLabel"
+            self.style.configure(self.icon_styles[color], foreground=color)
+        return self.icon_styles[color]
+
+    def set_theme(self, name):
+        """Switch the colour palette without re-rendering any widgets"""
+        self.theme = name
+        for attribute, value in THEMES[name].items():
+            setattr(self, attribute, value)
+        self.configure_styles()
+
+    def change_font_size(self, step):
+        """Grow or shrink every named font in place"""
+        self.font_offset = max(-4, min(8, self.font_offset + step))
+        for name, (size, _, _) in FONT_SIZES.items():
+            self.fonts[name].configure(size=size + self.font_offset)
+
+    def set_hover(self, event, style):
+        """Swap a frame's style on mouse enter/leave"""
+        event.widget.configure(style=style)
+
+    def set_card_hover(self, event, hovered):
+        """Highlight a task card's background on mouse enter/leave"""
+        event.widget.configure(bg=self.hover_color if hovered else self.bg_color)
+
     def create_main_layout(self):
         # Main container with shadow effect
         self.main_container = tk.Frame(
             self.root,
             bg=self.bg_color,
-            highlightbackground="#e0e0e0",
+            highlightbackground=self.border_color,
             highlightthickness=1
         )
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Sidebar with improved styling
-        self.sidebar_frame = tk.Frame(
+        self.sidebar_frame = ttk.Frame(
             self.main_container,
             width=280,
-            bg=self.sidebar_color,
-            relief="flat"
+            style="Sidebar.TFrame"
         )
         self.sidebar_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
         self.sidebar_frame.pack_propagate(False)
         
         # Content area with card-like appearance
-        self.content_frame = tk.Frame(
-            self.main_container,
-            bg=self.bg_color,
-            relief="flat"
-        )
+        self.content_frame = ttk.Frame(self.main_container, style="App.TFrame")
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Create improved sidebar and content
@@ -90,9 +285,9 @@ class AdvancedTodoApp:
 
     def create_category_button(self, category):
         # Create hoverable category button
-        category_frame = tk.Frame(
+        category_frame = ttk.Frame(
             self.categories_frame,
-            bg=self.sidebar_color,
+            style="Sidebar.TFrame",
             height=40,
             cursor="hand2"
         )
@@ -100,42 +295,30 @@ class AdvancedTodoApp:
         category_frame.pack_propagate(False)
         
         # Add hover effect
-        def on_enter(e):
-            category_frame.configure(bg="#f8f9fa")
-            
-        def on_leave(e):
-            category_frame.configure(bg=self.sidebar_color)
-        
-        category_frame.bind("<Enter>", on_enter)
-        category_frame.bind("<Leave>", on_leave)
+        category_frame.bind("<Enter>", lambda e: self.set_hover(e, "SidebarHover.TFrame"))
+        category_frame.bind("<Leave>", lambda e: self.set_hover(e, "Sidebar.TFrame"))
         
         # Category content with improved styling
-        icon_label = tk.Label(
+        icon_label = ttk.Label(
             category_frame,
             text=category["icon"],
-            font=("Segoe UI", 14),
-            bg=category_frame.cget("bg"),
-            fg=category["color"] if category["color"] != "#FFFFFF" else self.text_color,
+            style=self.get_icon_style(category["color"]),
             width=2
         )
         icon_label.pack(side=tk.LEFT, padx=(15, 5))
         
-        name_label = tk.Label(
+        name_label = ttk.Label(
             category_frame,
             text=category["name"],
-            font=("Segoe UI", 11),
-            bg=category_frame.cget("bg"),
-            fg=self.text_color,
+            style="Sidebar.TLabel",
             anchor="w"
         )
         name_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        count_label = tk.Label(
+        count_label = ttk.Label(
             category_frame,
             text=str(category["count"]),
-            font=("Segoe UI", 11),
-            bg=category_frame.cget("bg"),
-            fg=self.light_text,
+            style="SidebarMuted.TLabel",
             width=3
         )
         count_label.pack(side=tk.RIGHT, padx=15)
@@ -150,20 +333,14 @@ class AdvancedTodoApp:
             parent,
             bg=self.bg_color,
             relief="flat",
-            highlightbackground="#e0e0e0",
+            highlightbackground=self.border_color,
             highlightthickness=1
         )
         task_frame.pack(fill=tk.X, pady=5, padx=5)
         
         # Add hover effect
-        def on_enter(e):
-            task_frame.configure(bg="#f8f9fa")
-            
-        def on_leave(e):
-            task_frame.configure(bg=self.bg_color)
-        
-        task_frame.bind("<Enter>", on_enter)
-        task_frame.bind("<Leave>", on_leave)
+        task_frame.bind("<Enter>", lambda e: self.set_card_hover(e, True))
+        task_frame.bind("<Leave>", lambda e: self.set_card_hover(e, False))
         
         # Checkbox with custom style
         checkbox_var = tk.BooleanVar(value=task.get("completed", False))
@@ -176,7 +353,7 @@ class AdvancedTodoApp:
         checkbox.pack(side=tk.LEFT, padx=10)
         
         # Task content
-        content_frame = tk.Frame(task_frame, bg=task_frame.cget("bg"))
+        content_frame = ttk.Frame(task_frame, style="TaskContent.TFrame")
         content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=8)
         
         # Title with strike-through if completed
@@ -184,63 +361,66 @@ class AdvancedTodoApp:
         if task.get("completed", False):
             title_text = "✓ " + title_text
         
-        title_label = tk.Label(
+        title_label = ttk.Label(
             content_frame,
             text=title_text,
-            font=("Segoe UI", 11, "overstrike" if task.get("completed", False) else "normal"),
-            bg=content_frame.cget("bg"),
-            fg=self.light_text if task.get("completed", False) else self.text_color,
+            style="TaskDone.TLabel" if task.get("completed", False) else "TaskTitle.TLabel",
             anchor="w"
         )
         title_label.pack(fill=tk.X)
         
         # Task details
-        details_frame = tk.Frame(content_frame, bg=content_frame.cget("bg"))
+        details_frame = ttk.Frame(content_frame, style="TaskContent.TFrame")
         details_frame.pack(fill=tk.X, pady=(5, 0))
         
         # Time slot
         if task.get("time_slot"):
-            tk.Label(
+            ttk.Label(
                 details_frame,
                 text="🕒 " + task["time_slot"],
-                font=("Segoe UI", 9),
-                bg=details_frame.cget("bg"),
-                fg=self.light_text
+                style="TaskDetail.TLabel"
+            ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Recurrence
+        if "occurrence" in task:
+            repeat_text = "🔁 " + task["template"]["recurrence"]["freq"].capitalize()
+            if task["occurrence"] != date.today().isoformat():
+                repeat_text += " · " + task["occurrence"]
+            ttk.Label(
+                details_frame,
+                text=repeat_text,
+                style="TaskDetail.TLabel"
             ).pack(side=tk.LEFT, padx=(0, 10))
         
         # Category
         if task.get("category"):
             category = next((c for c in self.categories if c["name"] == task["category"]), None)
             if category:
-                tk.Label(
+                ttk.Label(
                     details_frame,
                     text=f"{category['icon']} {category['name']}",
-                    font=("Segoe UI", 9),
-                    bg=details_frame.cget("bg"),
-                    fg=self.light_text
+                    style="TaskDetail.TLabel"
                 ).pack(side=tk.LEFT, padx=(0, 10))
         
         # Action buttons
-        action_frame = tk.Frame(task_frame, bg=task_frame.cget("bg"))
+        action_frame = ttk.Frame(task_frame, style="TaskContent.TFrame")
         action_frame.pack(side=tk.RIGHT, padx=10)
         
         # Edit button
-        edit_btn = tk.Label(
+        edit_btn = ttk.Label(
             action_frame,
             text="✏️",
-            font=("Segoe UI", 12),
-            bg=action_frame.cget("bg"),
+            style="TaskAction.TLabel",
             cursor="hand2"
         )
         edit_btn.pack(side=tk.LEFT, padx=5)
         edit_btn.bind("<Button-1>", lambda e, t=task: self.view_task_details(t))
         
         # Delete button
-        delete_btn = tk.Label(
+        delete_btn = ttk.Label(
             action_frame,
             text="🗑️",
-            font=("Segoe UI", 12),
-            bg=action_frame.cget("bg"),
+            style="TaskAction.TLabel",
             cursor="hand2"
         )
         delete_btn.pack(side=tk.LEFT, padx=5)
@@ -255,6 +435,8 @@ class AdvancedTodoApp:
                 "category": "Home",
                 "completed": False
             }
+            if not self.mark_dirty(new_task):
+                return
             self.tasks.append(new_task)
             self.update_task_list()
             self.update_category_counts()
@@ -267,6 +449,8 @@ class AdvancedTodoApp:
             selection = self.task_listbox.curselection()
             if selection:
                 index = selection[0]
+                if not self.mark_dirty(self.tasks[index]):
+                    return
                 self.task_listbox.delete(index)
                 self.tasks.pop(index)
                 self.save_data()  # Save after removing task
@@ -277,18 +461,16 @@ class AdvancedTodoApp:
 
     def create_sidebar(self):
         # Private label
-        self.private_label = tk.Label(
+        self.private_label = ttk.Label(
             self.sidebar_frame, 
             text="Private", 
-            font=("Segoe UI", 16, "bold"),
-            bg=self.sidebar_color,
-            fg=self.text_color,
+            style="SidebarHeading.TLabel",
             anchor="w"
         )
         self.private_label.pack(fill=tk.X, padx=15, pady=(15, 10))
         
         # Categories frame
-        self.categories_frame = tk.Frame(self.sidebar_frame, bg=self.sidebar_color)
+        self.categories_frame = ttk.Frame(self.sidebar_frame, style="Sidebar.TFrame")
         self.categories_frame.pack(fill=tk.X, padx=10, pady=5)
         
         # Initialize categories if not already done
@@ -306,20 +488,18 @@ class AdvancedTodoApp:
             self.create_category_button(category)
         
         # Add "Create new list" button
-        create_list_btn = tk.Frame(
+        create_list_btn = ttk.Frame(
             self.sidebar_frame, 
-            bg=self.sidebar_color,
+            style="Sidebar.TFrame",
             height=35,
             cursor="hand2"
         )
         create_list_btn.pack(fill=tk.X, padx=10, pady=5)
         
-        create_list_label = tk.Label(
+        create_list_label = ttk.Label(
             create_list_btn,
             text="+ Create new list",
-            font=("Segoe UI", 10),
-            bg=self.sidebar_color,
-            fg=self.text_color,
+            style="SidebarLink.TLabel",
             cursor="hand2"
         )
         create_list_label.pack(side=tk.LEFT, padx=15)
@@ -327,35 +507,29 @@ class AdvancedTodoApp:
 
     def create_content_area(self):
         # Header frame
-        self.header_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        self.header_frame = ttk.Frame(self.content_frame, style="App.TFrame")
         self.header_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Greeting text
-        self.greeting_label = tk.Label(
+        self.greeting_label = ttk.Label(
             self.header_frame,
             text="Hey there! 👋",
-            font=("Segoe UI", 16, "bold"),
-            bg=self.bg_color,
-            fg=self.text_color
+            style="Heading.TLabel"
         )
         self.greeting_label.pack(side=tk.LEFT, padx=10)
         
         # Add task button
-        self.add_task_btn = tk.Label(
+        self.add_task_btn = ttk.Label(
             self.header_frame,
             text="+ Add Task",
-            font=("Segoe UI", 11),
-            bg=self.primary_color,
-            fg="white",
-            padx=15,
-            pady=5,
+            style="Accent.TLabel",
             cursor="hand2"
         )
         self.add_task_btn.pack(side=tk.RIGHT, padx=10)
         self.add_task_btn.bind("<Button-1>", lambda e: self.show_add_task_dialog())
         
         # Tasks container
-        self.tasks_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        self.tasks_container = ttk.Frame(self.content_frame, style="App.TFrame")
         self.tasks_container.pack(fill=tk.BOTH, expand=True, padx=10)
 
     def create_new_category(self, event=None):
@@ -381,26 +555,26 @@ class AdvancedTodoApp:
         # Create a top-level window for the dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Add New Task")
-        dialog.geometry("400x300")
+        dialog.geometry("400x380")
         dialog.configure(bg=self.bg_color)
         
         # Task title entry
         tk.Label(
             dialog,
             text="Task Title:",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.bg_color,
             fg=self.text_color
         ).pack(padx=20, pady=(20, 5), anchor="w")
         
-        title_entry = tk.Entry(dialog, font=("Segoe UI", 11), width=40)
+        title_entry = tk.Entry(dialog, font=self.fonts["body"], width=40)
         title_entry.pack(padx=20, pady=(0, 15))
         
         # Category selection
         tk.Label(
             dialog,
             text="Category:",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.bg_color,
             fg=self.text_color
         ).pack(padx=20, pady=(0, 5), anchor="w")
@@ -411,10 +585,12 @@ class AdvancedTodoApp:
             textvariable=category_var,
             values=[cat["name"] for cat in self.categories],
             state="readonly",
-            font=("Segoe UI", 11)
+            font=self.fonts["body"]
         )
         category_menu.pack(padx=20, pady=(0, 15))
         
+        repeat_var = self.create_repeat_selector(dialog, "Never")
+        
         def add_task():
             title = title_entry.get().strip()
             if title:
@@ -423,6 +599,9 @@ class AdvancedTodoApp:
                     "category": category_var.get(),
                     "completed": False
                 }
+                self.set_task_recurrence(new_task, repeat_var.get())
+                if not self.mark_dirty(new_task):
+                    return
                 self.tasks.append(new_task)
                 self.update_task_list()
                 self.update_category_counts()
@@ -435,9 +614,9 @@ class AdvancedTodoApp:
         tk.Button(
             dialog,
             text="Add Task",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.primary_color,
-            fg="white",
+            fg=self.on_primary_color,
             command=add_task,
             padx=20,
             pady=5,
@@ -447,34 +626,37 @@ class AdvancedTodoApp:
 
     def update_task_list(self):
         """Update the task list display"""
+        self.record_render()
+        
         # Clear existing tasks
         for widget in self.tasks_container.winfo_children():
             widget.destroy()
         
+        # Expand recurring tasks into their visible occurrences
+        rows = self.get_task_rows()
+        
         # Filter tasks based on selected category
         display_tasks = []
         if hasattr(self, 'current_category'):
             if self.current_category["name"] == "Home":
                 # Show all tasks for Home category
-                display_tasks = self.tasks
+                display_tasks = rows
             elif self.current_category["name"] == "Completed":
                 # Show only completed tasks
-                display_tasks = [t for t in self.tasks if t.get("completed", False)]
+                display_tasks = [t for t in rows if t.get("completed", False)]
             else:
                 # Show tasks for specific category
-                display_tasks = [t for t in self.tasks if t.get("category") == self.current_category["name"]]
+                display_tasks = [t for t in rows if t.get("category") == self.current_category["name"]]
         else:
             # If no category selected, show all tasks
-            display_tasks = self.tasks
+            display_tasks = rows
         
         # Add "No tasks" message if list is empty
         if not display_tasks:
-            no_tasks_label = tk.Label(
+            no_tasks_label = ttk.Label(
                 self.tasks_container,
                 text="No tasks to display",
-                font=("Segoe UI", 12),
-                bg=self.bg_color,
-                fg=self.light_text
+                style="Empty.TLabel"
             )
             no_tasks_label.pack(pady=20)
             return
@@ -484,13 +666,15 @@ class AdvancedTodoApp:
             self.create_task_item(self.tasks_container, task)
 
     def update_category_counts(self):
+        self.record_render()
+        rows = self.get_task_rows()
         for category in self.categories:
             if category["name"] == "Home":
-                category["count"] = len(self.tasks)
+                category["count"] = len(rows)
             elif category["name"] == "Completed":
-                category["count"] = len([t for t in self.tasks if t.get("completed", False)])
+                category["count"] = len([t for t in rows if t.get("completed", False)])
             else:
-                category["count"] = len([t for t in self.tasks if t.get("category") == category["name"]])
+                category["count"] = len([t for t in rows if t.get("category") == category["name"]])
         
         # Refresh sidebar
         for widget in self.categories_frame.winfo_children():
@@ -499,39 +683,171 @@ class AdvancedTodoApp:
         for category in self.categories:
             self.create_category_button(category)
 
+    def get_task_rows(self):
+        """Return regular tasks plus virtual rows for visible recurring occurrences"""
+        today = date.today()
+        rows = []
+        for task in self.tasks:
+            if task.get("recurrence") and not task.get("completed", False):
+                rows.extend(self.get_occurrence_rows(task, today))
+            else:
+                rows.append(task)
+        return rows
+
+    def get_occurrence_rows(self, task, today):
+        """Generate the occurrences of a recurring task that fall in today's window"""
+        today_iso = today.isoformat()
+        rows = []
+        
+        # Occurrences completed today stay visible, struck through
+        if today_iso in task.get("exceptions", []):
+            rows.append(self.make_occurrence_row(task, today_iso, True))
+        
+        # Only the next pending occurrence is generated, once it is due
+        next_day = self.next_occurrence(task, today)
+        if next_day <= today:
+            rows.append(self.make_occurrence_row(task, next_day.isoformat(), False))
+        return rows
+
+    def make_occurrence_row(self, task, day, completed):
+        """Build a virtual row for one occurrence of a recurring task"""
+        return {
+            "title": task.get("title", "Untitled Task"),
+            "category": task.get("category"),
+            "time_slot": task.get("time_slot"),
+            "completed": completed,
+            "occurrence": day,
+            "template": task
+        }
+
+    def next_occurrence(self, task, today):
+        """Return the date of the first occurrence not yet completed
+        
+        Occurrences missed before today's window are skipped, so a chore
+        left alone for days shows up once, for the current period.
+        """
+        rule = task["recurrence"]
+        step = timedelta(days=REPEAT_OPTIONS[rule["freq"].capitalize()] * rule.get("interval", 1))
+        done = set(task.get("exceptions", []))
+        
+        day = date.fromisoformat(rule["start"])
+        if day < today:
+            # Jump to the latest scheduled date on or before today
+            day += step * ((today - day) // step)
+        while day.isoformat() in done:
+            day += step
+        return day
+
+    def check_recurrences(self, tasks):
+        """Turn tasks with an unusable recurrence rule into plain tasks
+        
+        Returns True if any task was changed, so the caller can rewrite it.
+        """
+        changed = False
+        for task in tasks:
+            rule = task.get("recurrence")
+            if rule is None:
+                continue
+            try:
+                valid = (
+                    REPEAT_OPTIONS.get(rule["freq"].capitalize()) is not None
+                    and isinstance(rule.get("interval", 1), int)
+                    and rule.get("interval", 1) > 0
+                    and date.fromisoformat(rule["start"]) is not None
+                )
+            except (AttributeError, KeyError, TypeError, ValueError):
+                valid = False
+            if not valid:
+                print(f"Ignoring invalid recurrence {rule!r} on task {task.get('title')!r}")
+                task.pop("recurrence", None)
+                task.pop("exceptions", None)
+                changed = True
+        return changed
+
+    def toggle_occurrence(self, row):
+        """Complete or reopen one occurrence of a recurring task"""
+        task = row["template"]
+        rule = task["recurrence"]
+        exceptions = task.setdefault("exceptions", [])
+        
+        if row["occurrence"] in exceptions:
+            exceptions.remove(row["occurrence"])
+            rule["start"] = min(rule["start"], row["occurrence"])
+        else:
+            exceptions.append(row["occurrence"])
+        
+        # Compact: move the start up to the first pending occurrence and
+        # keep only the exceptions that are still inside the visible window
+        today = date.today()
+        rule["start"] = self.next_occurrence(task, today).isoformat()
+        window_start = min(rule["start"], today.isoformat())
+        task["exceptions"] = sorted(d for d in exceptions if d >= window_start)
+
+    def set_task_recurrence(self, task, repeat):
+        """Apply a REPEAT_OPTIONS choice to a task"""
+        if REPEAT_OPTIONS.get(repeat) is None:
+            task.pop("recurrence", None)
+            task.pop("exceptions", None)
+        elif task.get("recurrence", {}).get("freq") != repeat.lower():
+            task["recurrence"] = {
+                "freq": repeat.lower(),
+                "interval": 1,
+                "start": date.today().isoformat()
+            }
+            task["exceptions"] = []
+
+    def create_repeat_selector(self, dialog, initial):
+        """Add a labelled repeat combobox to a task dialog"""
+        tk.Label(
+            dialog,
+            text="Repeat:",
+            font=self.fonts["body"],
+            bg=self.bg_color,
+            fg=self.text_color
+        ).pack(padx=20, pady=(0, 5), anchor="w")
+        
+        repeat_var = tk.StringVar(value=initial)
+        repeat_menu = ttk.Combobox(
+            dialog,
+            textvariable=repeat_var,
+            values=list(REPEAT_OPTIONS),
+            state="readonly",
+            font=self.fonts["body"]
+        )
+        repeat_menu.pack(padx=20, pady=(0, 15))
+        return repeat_var
+
     def bind_shortcuts(self):
         self.root.bind("<Control-n>", lambda e: self.show_add_task_dialog())
         self.root.bind("<Control-l>", lambda e: self.create_new_category())
         self.root.bind("<Control-s>", lambda e: self.save_data())
+        self.root.bind("<Control-equal>", lambda e: self.change_font_size(1))
+        self.root.bind("<Control-minus>", lambda e: self.change_font_size(-1))
 
     def load_data(self):
         """Load tasks and categories from files"""
         try:
+            migrated = False
+            
             # Load tasks
-            if os.path.exists(self.tasks_file):
-                with open(self.tasks_file, 'r') as f:
-                    loaded_tasks = json.load(f)
-                    # Convert any string tasks to dictionary format
-                    self.tasks = []
-                    for task in loaded_tasks:
-                        if isinstance(task, str):
-                            # Convert string task to dictionary format
-                            self.tasks.append({
-                                "title": task,
-                                "category": "Home",
-                                "completed": False
-                            })
-                        else:
-                            self.tasks.append(task)
-                    print(f"Loaded {len(self.tasks)} tasks from {self.tasks_file}")
+            if os.path.exists(self.manifest_file):
+                self.load_manifest()
+            elif os.path.exists(self.tasks_file):
+                tasks, tasks_migrated = self.read_versioned_file(self.tasks_file, "tasks")
+                self.tasks = tasks if tasks is not None else []
+                migrated = self.check_recurrences(self.tasks) or migrated or tasks_migrated
+                print(f"Loaded {len(self.tasks)} tasks from {self.tasks_file}")
             else:
                 self.tasks = []
                 print("No tasks file found, starting with empty tasks list")
             
             # Load categories
+            categories = None
             if os.path.exists(self.categories_file):
-                with open(self.categories_file, 'r') as f:
-                    self.categories = json.load(f)
+                categories, categories_migrated = self.read_versioned_file(self.categories_file, "categories")
+                migrated = migrated or categories_migrated
+            if categories is not None:
+                self.categories = categories
                 print(f"Loaded {len(self.categories)} categories from {self.categories_file}")
             else:
                 # Default categories if file doesn't exist
@@ -543,10 +859,24 @@ class AdvancedTodoApp:
                     {"name": "Diet", "icon": "👍", "color": "#ffcc00", "count": 0}
                 ]
                 print("No categories file found, using default categories")
+            
+            # Persist upgraded files once so later loads take the fast path
+            if migrated:
+                self.save_data()
+                self.save_categories()
         except Exception as e:
-            messagebox.showerror("Error Loading Data", f"Failed to load data: {str(e)}")
-            # Fall back to empty data
+            messagebox.showerror(
+                "Error Loading Data",
+                f"Failed to load data: {str(e)}\n\nChanges will not be saved this session so the files and backups stay intact."
+            )
+            # Fall back to empty data, without ever saving it over the files
+            self.load_failed = True
             self.tasks = []
+            self.sharded = False
+            self.shard_files = {}
+            self.pending_shards = []
+            self.dirty_shards = set()
+            self.failed_shards = set()
             self.categories = [
                 {"name": "Home", "icon": "🏠", "color": "#FFFFFF", "count": 0},
                 {"name": "Completed", "icon": "☑", "color": "#FFFFFF", "count": 0},
@@ -555,12 +885,325 @@ class AdvancedTodoApp:
                 {"name": "Diet", "icon": "👍", "color": "#ffcc00", "count": 0}
             ]
 
+    def shard_name(self, task):
+        """Return the name of the shard a task is stored in"""
+        return task.get("category") or "Home"
+
+    def mark_dirty(self, *tasks):
+        """Flag the shards holding these tasks for the next save
+        
+        Returns False, after telling the user, if one of them failed to load;
+        the caller must then leave the tasks unchanged.
+        """
+        names = {self.shard_name(task) for task in tasks}
+        # A shard must be in memory before it is rewritten
+        self.ensure_shards_loaded(names)
+        if not self.check_shards_writable(names):
+            return False
+        self.dirty_shards.update(names)
+        return True
+
+    def mark_all_dirty(self):
+        """Flag every shard, e.g. before replacing the whole task list"""
+        self.ensure_shards_loaded()
+        if not self.check_shards_writable(self.shard_files):
+            return False
+        self.dirty_shards.update(self.shard_files)
+        self.dirty_shards.update(self.shard_name(task) for task in self.tasks)
+        return True
+
+    def check_shards_writable(self, names):
+        """Show an error and return False if any of these shards failed to load"""
+        failed = sorted(self.failed_shards.intersection(names))
+        if failed:
+            messagebox.showerror(
+                "Error Saving Data",
+                f"The {', '.join(failed)} list failed to load, so it cannot be changed. Restart the app to try loading it again."
+            )
+            return False
+        return True
+
+    def load_manifest(self):
+        """Load the shard manifest and the shards the last viewed category needs"""
+        manifest, migrated = self.read_versioned_file(self.manifest_file, "shards")
+        if manifest is None:
+            manifest = self.rebuild_manifest()
+        self.sharded = True
+        self.shard_files = manifest["shards"]
+        self.saved_category = manifest["current"]
+        self.current_category = {"name": manifest["current"]}
+        self.tasks = []
+        if migrated:
+            self.write_manifest()
+        
+        # Shards for the restored view are loaded now, the rest once the UI is idle
+        self.pending_shards = list(self.shard_files)
+        self.ensure_shards_loaded(self.shards_for_category(manifest["current"]))
+        if self.pending_shards:
+            self.root.after_idle(self.load_next_shard)
+        print(f"Loaded shard manifest with {len(self.shard_files)} shards from {self.manifest_file}")
+
+    def rebuild_manifest(self):
+        """Recreate the shard map from the shard files after the manifest was lost"""
+        shards = {}
+        for file_name in sorted(os.listdir(self.shards_dir)):
+            if not file_name.endswith(".json") or file_name == os.path.basename(self.manifest_file):
+                continue
+            tasks, _ = self.read_versioned_file(os.path.join(self.shards_dir, file_name), "tasks")
+            if tasks:
+                shards[self.shard_name(tasks[0])] = file_name
+        print(f"Rebuilt shard manifest with {len(shards)} shards")
+        return {"current": "Home", "shards": shards}
+
+    def write_manifest(self):
+        """Write the shard map and the last viewed category"""
+        self.saved_category = self.current_category["name"]
+        manifest = {"current": self.saved_category, "shards": self.shard_files}
+        self.write_versioned_file(self.manifest_file, "shards", manifest)
+
+    def shards_for_category(self, name):
+        """Return the shards a category view needs, or None for all of them"""
+        # Home and Completed span every shard, other views need just their own
+        if name in ("Home", "Completed"):
+            return None
+        return {name}
+
+    def load_shard(self, name):
+        """Read one category shard into the task list"""
+        path = os.path.join(self.shards_dir, self.shard_files[name])
+        try:
+            tasks, migrated = self.read_versioned_file(path, "tasks")
+        except Exception as e:
+            # Keep the shard on disk untouched rather than overwrite it later
+            self.failed_shards.add(name)
+            messagebox.showerror("Error Loading Data", f"Failed to load the {name} list: {str(e)}")
+            return
+        if tasks is None:
+            tasks = []
+        self.tasks.extend(tasks)
+        if self.check_recurrences(tasks) or migrated:
+            self.dirty_shards.add(name)
+
+    def load_next_shard(self):
+        """Load one pending shard per idle callback, refreshing the UI when done"""
+        if not self.pending_shards:
+            return
+        self.load_shard(self.pending_shards.pop(0))
+        if self.pending_shards:
+            self.root.after_idle(self.load_next_shard)
+        else:
+            self.update_task_list()
+            self.update_category_counts()
+
+    def ensure_shards_loaded(self, names=None):
+        """Synchronously load pending shards (all of them if names is None)
+        
+        Returns True if any shard was loaded.
+        """
+        loaded = False
+        for name in list(self.pending_shards):
+            if names is None or name in names:
+                self.pending_shards.remove(name)
+                self.load_shard(name)
+                loaded = True
+        return loaded
+
+    def save_shards(self):
+        """Rewrite only the dirty shards and, if it changed, the manifest"""
+        if not os.path.exists(self.shards_dir):
+            os.makedirs(self.shards_dir)
+        
+        manifest_changed = not os.path.exists(self.manifest_file)
+        manifest_changed = manifest_changed or self.saved_category != self.current_category["name"]
+        failed = self.failed_shards.intersection(self.dirty_shards)
+        if failed:
+            # mark_dirty refuses these, so reaching here is a bug; never drop edits silently
+            raise ValueError(f"Cannot save lists that failed to load: {', '.join(sorted(failed))}")
+        
+        for name in sorted(self.dirty_shards):
+            tasks = [task for task in self.tasks if self.shard_name(task) == name]
+            if name not in self.shard_files:
+                self.shard_files[name] = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16] + ".json"
+                manifest_changed = True
+            
+            path = os.path.join(self.shards_dir, self.shard_files[name])
+            if tasks:
+                self.write_versioned_file(path, "tasks", tasks)
+            else:
+                # Drop empty shards instead of keeping empty files around
+                self.remove_versioned_file(path)
+                del self.shard_files[name]
+                manifest_changed = True
+        
+        if manifest_changed:
+            self.write_manifest()
+        print(f"Saved {len(self.dirty_shards)} shards to {self.shards_dir}")
+
+    def toggle_sharded_storage(self):
+        """Switch between a single tasks.json and per-category shards"""
+        if self.failed_shards or self.load_failed:
+            # Converting would drop the tasks in files that failed to load
+            messagebox.showerror("Storage", "Some lists failed to load, so storage cannot be converted.")
+            self.sharded_var.set(self.sharded)
+            return
+        
+        self.mark_all_dirty()
+        self.sharded = self.sharded_var.get()
+        if not self.save_data():
+            return
+        
+        if self.sharded:
+            self.remove_versioned_file(self.tasks_file)
+        else:
+            for file_name in self.shard_files.values():
+                self.remove_versioned_file(os.path.join(self.shards_dir, file_name))
+            self.remove_versioned_file(self.manifest_file)
+            self.shard_files = {}
+
+    def read_versioned_file(self, path, key):
+        """Read a data file, returning its records and whether it needs rewriting
+        
+        Falls back to the newest backup whose checksum verifies if the file
+        itself is damaged, e.g. truncated by a crash during a save. Damaged
+        snapshots are moved aside to <name>.corrupt so they never rotate a
+        good backup out. If no snapshot is readable the records are None and
+        the caller starts fresh.
+        """
+        candidates = [path] + [f"{path}.{n}" for n in range(1, BACKUP_COUNT + 1)]
+        damaged = []
+        for candidate in candidates:
+            if not os.path.exists(candidate):
+                continue
+            
+            try:
+                header, data = self.read_snapshot(candidate)
+            except ValueError as e:
+                print(f"Damaged snapshot {candidate} ({e}), trying an older one")
+                damaged.append(candidate)
+                continue
+            
+            if damaged:
+                self.set_aside_damaged(damaged)
+                self.compact_backups(path)
+                print(f"Recovered {path} from backup {candidate}")
+            
+            # Fast path: current-version files need no per-record normalization
+            if header is not None and header["version"] == DATA_VERSION and candidate == path:
+                return data, False
+            return self.snapshot_records(header, data, key), True
+        
+        # Nothing readable: keep the damaged files for inspection and start fresh
+        self.set_aside_damaged(damaged)
+        messagebox.showwarning(
+            "Damaged Data",
+            f"{os.path.basename(path)} was damaged and no backup could be read.\n\n"
+            f"It was moved to {os.path.basename(path)}.corrupt and an empty file will be used instead."
+        )
+        return None, True
+
+    def snapshot_records(self, header, data, key):
+        """Return the records of a parsed snapshot, migrated to DATA_VERSION"""
+        if header is None:
+            # Files older than version 3 are plain JSON without a header
+            return self.migrate_data(data, key)
+        return self.migrate_data({"version": header["version"], key: data}, key)
+
+    def set_aside_damaged(self, paths):
+        """Move damaged snapshots out of the backup rotation"""
+        for damaged_path in paths:
+            os.replace(damaged_path, damaged_path + ".corrupt")
+
+    def compact_backups(self, path):
+        """Renumber the remaining backups of path as .1, .2, ... without gaps"""
+        backups = [f"{path}.{n}" for n in range(1, BACKUP_COUNT + 1) if os.path.exists(f"{path}.{n}")]
+        for n, backup in enumerate(backups, 1):
+            if backup != f"{path}.{n}":
+                os.replace(backup, f"{path}.{n}")
+
+    def read_snapshot(self, path):
+        """Read a data file in one pass, returning its header (if any) and parsed body
+        
+        Raises ValueError if the file is damaged: a cut-off or garbled header,
+        a checksum mismatch, or a body that is not valid JSON.
+        """
+        with open(path, 'rb') as f:
+            first_line = f.readline()
+            rest = f.read()
+        
+        if not first_line.startswith(SNAPSHOT_HEADER_PREFIX):
+            # Files older than version 3 are plain JSON without a header
+            return None, json.loads(first_line + rest)
+        
+        header = json.loads(first_line)
+        if not isinstance(header, dict) or "version" not in header:
+            raise ValueError("invalid header")
+        if hashlib.sha256(rest).hexdigest() != header.get("checksum"):
+            raise ValueError("checksum mismatch")
+        return header, json.loads(rest)
+
+    def migrate_data(self, data, key):
+        """Upgrade a loaded payload to DATA_VERSION and return its records"""
+        if isinstance(data, list):
+            # Version 1 files were a bare list without a header
+            data = {"version": 1, key: data}
+        
+        version = data.get("version", 1)
+        if version > DATA_VERSION:
+            raise ValueError(f"Unsupported data version {version} (expected {DATA_VERSION} or older)")
+        
+        while version < DATA_VERSION:
+            data = MIGRATIONS[version](data, key)
+            version = data["version"]
+        return data[key]
+
+    def write_versioned_file(self, path, key, records):
+        """Write records to a data file under a checksummed version header
+        
+        The new snapshot is written to a temporary file and swapped in
+        atomically, so a crash mid-save never leaves a truncated file. The
+        previous snapshot is kept as path.1, shifting older ones up to
+        path.<BACKUP_COUNT>.
+        """
+        body = json.dumps(records, indent=2).encode("utf-8")
+        header = json.dumps({"checksum": hashlib.sha256(body).hexdigest(), "version": DATA_VERSION})
+        
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(header.encode("utf-8") + b"\n")
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if os.path.exists(path):
+            for n in range(BACKUP_COUNT, 1, -1):
+                if os.path.exists(f"{path}.{n - 1}"):
+                    os.replace(f"{path}.{n - 1}", f"{path}.{n}")
+            # Link rather than move so the current file never goes missing
+            try:
+                os.link(path, f"{path}.1")
+            except OSError:
+                shutil.copy2(path, f"{path}.1")
+        
+        os.replace(temp_path, path)
+
+    def remove_versioned_file(self, path):
+        """Delete a data file together with its backups"""
+        for candidate in [path] + [f"{path}.{n}" for n in range(1, BACKUP_COUNT + 1)]:
+            if os.path.exists(candidate):
+                os.remove(candidate)
+
     def save_data(self, event=None):
         """Save tasks to file"""
+        if self.load_failed:
+            print("Not saving tasks because loading failed")
+            return False
         try:
-            with open(self.tasks_file, 'w') as f:
-                json.dump(self.tasks, f, indent=2)
-            print(f"Saved {len(self.tasks)} tasks to {self.tasks_file}")
+            if self.sharded:
+                self.save_shards()
+            else:
+                self.write_versioned_file(self.tasks_file, "tasks", self.tasks)
+                print(f"Saved {len(self.tasks)} tasks to {self.tasks_file}")
+            self.dirty_shards.clear()
             return True
         except Exception as e:
             messagebox.showerror("Error Saving Data", f"Failed to save tasks: {str(e)}")
@@ -568,9 +1211,11 @@ class AdvancedTodoApp:
 
     def save_categories(self):
         """Save categories to file"""
+        if self.load_failed:
+            print("Not saving categories because loading failed")
+            return False
         try:
-            with open(self.categories_file, 'w') as f:
-                json.dump(self.categories, f, indent=2)
+            self.write_versioned_file(self.categories_file, "categories", self.categories)
             print(f"Saved {len(self.categories)} categories to {self.categories_file}")
             return True
         except Exception as e:
@@ -579,6 +1224,12 @@ class AdvancedTodoApp:
 
     def on_close(self):
         """Handle application closing"""
+        if self.load_failed:
+            # Nothing can be saved this session, so make sure the user knows
+            if messagebox.askyesno("Changes Not Saved", "Your data failed to load, so changes made in this session were not saved.\n\nClose anyway?"):
+                self.root.destroy()
+            return
+        
         # Save data before closing
         if self.save_data() and self.save_categories():
             self.root.destroy()
@@ -595,6 +1246,9 @@ class AdvancedTodoApp:
         file_menu.add_command(label="Export Tasks", command=self.export_tasks)
         file_menu.add_command(label="Import Tasks", command=self.import_tasks)
         file_menu.add_separator()
+        self.sharded_var = tk.BooleanVar(value=self.sharded)
+        file_menu.add_checkbutton(label="Store Lists Separately", variable=self.sharded_var, command=self.toggle_sharded_storage)
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_close)
         menubar.add_cascade(label="File", menu=file_menu)
         
@@ -609,6 +1263,20 @@ class AdvancedTodoApp:
         view_menu = tk.Menu(menubar, tearoff=0)
         view_menu.add_command(label="All Tasks", command=lambda: self.select_category({"name": "Home"}))
         view_menu.add_command(label="Completed Tasks", command=lambda: self.select_category({"name": "Completed"}))
+        view_menu.add_separator()
+        self.theme_var = tk.StringVar(value=self.theme)
+        for name in THEMES:
+            view_menu.add_radiobutton(label=f"{name} Theme", variable=self.theme_var, value=name, command=lambda n=name: self.set_theme(n))
+        view_menu.add_command(label="Larger Text", command=lambda: self.change_font_size(1), accelerator="Ctrl+=")
+        view_menu.add_command(label="Smaller Text", command=lambda: self.change_font_size(-1), accelerator="Ctrl+-")
+        view_menu.add_separator()
+        self.sampling_var = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(
+            label="Sample Resources Per Render",
+            variable=self.sampling_var,
+            command=lambda: self.set_render_sampling(self.sampling_var.get())
+        )
+        view_menu.add_command(label="Diagnostics", command=self.show_diagnostics)
         menubar.add_cascade(label="View", menu=view_menu)
         
         self.root.config(menu=menubar)
@@ -625,6 +1293,9 @@ class AdvancedTodoApp:
         
         if file_path:
             try:
+                self.ensure_shards_loaded()
+                # Exports stay a bare JSON list of tasks, as they always were,
+                # so other tools can read them; import accepts either format
                 with open(file_path, 'w') as f:
                     json.dump(self.tasks, f, indent=2)
                 messagebox.showinfo("Export Successful", f"Tasks exported to {file_path}")
@@ -643,13 +1314,19 @@ class AdvancedTodoApp:
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    imported_tasks = json.load(f)
+                # A user-picked file is read on its own, never from backups beside it
+                header, data = self.read_snapshot(file_path)
+                imported_tasks = self.snapshot_records(header, data, "tasks")
+                self.check_recurrences(imported_tasks)
                 
-                if messagebox.askyesno("Import Tasks", "Replace existing tasks or merge with them?\nYes = Replace, No = Merge"):
+                replace = messagebox.askyesno("Import Tasks", "Replace existing tasks or merge with them?\nYes = Replace, No = Merge")
+                if not (self.mark_all_dirty() if replace else self.mark_dirty(*imported_tasks)):
+                    return
+                if replace:
                     self.tasks = imported_tasks
                 else:
                     self.tasks.extend(imported_tasks)
+                self.mark_dirty(*imported_tasks)
                 
                 self.update_task_list()
                 self.update_category_counts()
@@ -661,11 +1338,16 @@ class AdvancedTodoApp:
     def select_category(self, category):
         """Handle category selection"""
         self.current_category = category
+        if self.ensure_shards_loaded(self.shards_for_category(category["name"])):
+            # Newly loaded shards change the sidebar counts too
+            self.update_category_counts()
         self.update_task_list()
 
     def clear_all_tasks(self):
         """Clear all tasks after confirmation"""
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all tasks? This action cannot be undone."):
+            if not self.mark_all_dirty():
+                return
             self.tasks = []
             self.update_task_list()
             self.update_category_counts()
@@ -674,7 +1356,14 @@ class AdvancedTodoApp:
 
     def toggle_task_completion(self, task):
         """Toggle task completion status"""
-        task["completed"] = not task.get("completed", False)
+        if not self.mark_dirty(task):
+            # Redraw so the checkbox goes back to the stored state
+            self.update_task_list()
+            return
+        if "occurrence" in task:
+            self.toggle_occurrence(task)
+        else:
+            task["completed"] = not task.get("completed", False)
         self.update_task_list()
         self.update_category_counts()
         self.save_data()  # Save after toggling completion
@@ -682,36 +1371,108 @@ class AdvancedTodoApp:
     def delete_task(self, task):
         """Delete a task"""
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this task?"):
-            self.tasks.remove(task)
-            self.update_task_list()
-            self.update_category_counts()
-            self.save_data()  # Save after deleting task
+            self.discard_task(task)
+
+    def discard_task(self, task):
+        """Remove a task without confirmation and refresh the UI"""
+        # Deleting an occurrence removes the whole recurring task
+        task = task.get("template", task)
+        if not self.mark_dirty(task):
+            return
+        self.tasks.remove(task)
+        self.update_task_list()
+        self.update_category_counts()
+        self.save_data()  # Save after deleting task
+
+    def record_render(self):
+        """Count a re-render, sampling resources as it starts if sampling is on"""
+        self.render_count += 1
+        if self.render_sampling:
+            self.render_samples.append(self.sample_resources())
+
+    def set_render_sampling(self, enabled):
+        """Switch per-render resource sampling on or off"""
+        self.render_sampling = enabled
+        if enabled:
+            self.render_samples.clear()
+
+    def sample_resources(self):
+        """Return the widget, Tcl variable, binding and heap block counts"""
+        widgets = 0
+        bindings = len(self.root.bind())
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            children = widget.winfo_children()
+            widgets += len(children)
+            for child in children:
+                bindings += len(child.bind())
+            stack.extend(children)
+        
+        return {
+            "renders": self.render_count,
+            "widgets": widgets,
+            "tcl_variables": len(self.root.tk.splitlist(self.root.tk.call("info", "vars"))),
+            "bindings": bindings,
+            # Live blocks in the interpreter's allocator, always available
+            "heap_blocks": sys.getallocatedblocks()
+        }
+
+    def get_resource_stats(self):
+        """Return live widget, Tcl variable, binding and Python heap counts"""
+        stats = self.sample_resources()
+        stats["tcl_commands"] = len(self.root.tk.splitlist(self.root.tk.call("info", "commands")))
+        stats["python_objects"] = len(gc.get_objects())
+        # Only available while tracemalloc is tracing, e.g. in the soak test
+        stats["heap_bytes"] = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        return stats
+
+    def get_render_history(self):
+        """Return the per-render resource samples, oldest first"""
+        return list(self.render_samples)
+
+    def show_diagnostics(self):
+        """Show resource counts and their growth over the recorded renders"""
+        stats = self.get_resource_stats()
+        first = self.render_samples[0] if self.render_samples else stats
+        lines = []
+        for name, value in stats.items():
+            if value is None:
+                continue
+            line = f"{name.replace('_', ' ').capitalize()}: {value}"
+            if name in first and name != "renders":
+                line += f" ({value - first[name]:+d} since render {first['renders']})"
+            lines.append(line)
+        messagebox.showinfo("Diagnostics", "\n".join(lines))
 
     def view_task_details(self, task):
         """View and edit task details"""
+        # Occurrences are edited through their recurring task
+        task = task.get("template", task)
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("Task Details")
-        dialog.geometry("400x300")
+        dialog.geometry("400x380")
         dialog.configure(bg=self.bg_color)
         
         # Task title entry
         tk.Label(
             dialog,
             text="Task Title:",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.bg_color,
             fg=self.text_color
         ).pack(padx=20, pady=(20, 5), anchor="w")
         
         title_var = tk.StringVar(value=task.get("title", ""))
-        title_entry = tk.Entry(dialog, font=("Segoe UI", 11), width=40, textvariable=title_var)
+        title_entry = tk.Entry(dialog, font=self.fonts["body"], width=40, textvariable=title_var)
         title_entry.pack(padx=20, pady=(0, 15))
         
         # Category selection
         tk.Label(
             dialog,
             text="Category:",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.bg_color,
             fg=self.text_color
         ).pack(padx=20, pady=(0, 5), anchor="w")
@@ -722,7 +1483,7 @@ class AdvancedTodoApp:
             textvariable=category_var,
             values=[cat["name"] for cat in self.categories],
             state="readonly",
-            font=("Segoe UI", 11)
+            font=self.fonts["body"]
         )
         category_menu.pack(padx=20, pady=(0, 15))
         
@@ -736,10 +1497,17 @@ class AdvancedTodoApp:
         )
         completed_cb.pack(padx=20, pady=(0, 15))
         
+        repeat = task.get("recurrence", {}).get("freq", "never").capitalize()
+        repeat_var = self.create_repeat_selector(dialog, repeat)
+        
         def save_changes():
+            # Both the old and the new category shard change on a move
+            if not self.mark_dirty(task, {"category": category_var.get()}):
+                return
             task["title"] = title_var.get()
             task["category"] = category_var.get()
             task["completed"] = completed_var.get()
+            self.set_task_recurrence(task, repeat_var.get())
             self.update_task_list()
             self.update_category_counts()
             self.save_data()  # Save after updating task
@@ -749,9 +1517,9 @@ class AdvancedTodoApp:
         tk.Button(
             dialog,
             text="Save Changes",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             bg=self.primary_color,
-            fg="white",
+            fg=self.on_primary_color,
             command=save_changes,
             padx=20,
             pady=5,
@@ -774,11 +1542,6 @@ class AdvancedTodoApp:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    
-    # Configure custom styles
-    style = ttk.Style()
-    style.configure("Custom.TCheckbutton", background="#f0f2f5", foreground="#202124")
-    
     app = AdvancedTodoApp(root)
     root.mainloop()
 